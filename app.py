@@ -1,7 +1,8 @@
+import time
 import streamlit as st
 from config.settings import PAGE_CONFIG
 from components.sidebar import render_sidebar, render_status_info
-from models.chat_model import init_model, get_normal_response, get_rag_response, get_boleto_identification_response
+from models.chat_model import init_model, get_normal_response, get_rag_response, get_boleto_identification_response, get_combined_response_stream
 
 # Configurar página
 st.set_page_config(**PAGE_CONFIG)
@@ -63,6 +64,8 @@ if prompt := st.chat_input("Digite sua mensagem aqui..."):
     with st.chat_message("assistant"):
         with st.spinner("Pensando..."):
             try:
+                response_streamed = False
+                
                 # Verificar se deve usar RAG ou chat normal
                 if (st.session_state.get('documents_processed', False) and 
                     st.session_state.get('vectorstore') is not None):
@@ -77,7 +80,30 @@ if prompt := st.chat_input("Digite sua mensagem aqui..."):
                     pergunta_lower = prompt.lower()
                     is_identification_query = any(palavra in pergunta_lower for palavra in palavras_identificacao)
                     
-                    if is_identification_query:
+                    if st.session_state.get('combined_mode', False):
+                        # Identificação, extração e RAG em paralelo, exibindo cada seção ao ficar pronta
+                        start = time.perf_counter()
+                        response_parts = []
+                        branch_total = 0.0
+                        
+                        for title, content, elapsed in get_combined_response_stream(
+                            prompt, 
+                            st.session_state.vectorstore, 
+                            llm
+                        ):
+                            section = f"### {title}\n{content}"
+                            st.markdown(section)
+                            st.caption(f"⏱️ {elapsed:.2f}s")
+                            response_parts.append(section)
+                            branch_total += elapsed
+                        
+                        total = time.perf_counter() - start
+                        st.caption(f"⏱️ Total: {total:.2f}s (soma das etapas: {branch_total:.2f}s)")
+                        
+                        assistant_response = "\n\n".join(response_parts)
+                        response_streamed = True
+                    
+                    elif is_identification_query:
                         # Usar identificação de empresas
                         assistant_response = get_boleto_identification_response(
                             prompt, 
@@ -98,7 +124,8 @@ if prompt := st.chat_input("Digite sua mensagem aqui..."):
                         llm
                     )
 
-                st.write(assistant_response)
+                if not response_streamed:
+                    st.write(assistant_response)
 
                 # Adicionar resposta ao histórico
                 st.session_state.messages.append({
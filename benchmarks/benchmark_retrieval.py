@@ -0,0 +1,67 @@
+"""
+Benchmark: custo adicional da busca multi-query em relação à similarity_search
+
+Uso: python benchmarks/benchmark_retrieval.py [--chunks 5000] [--runs 200]
+
+Usa embeddings falsos (sem API key), então mede apenas o custo local:
+expansão da pergunta, busca FAISS em lote, fusão e deduplicação. Nas duas
+rotas há uma única chamada de embedding por pergunta.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from langchain_community.vectorstores import FAISS
+from utils.fake_embeddings import FakeEmbeddings
+from utils.retrieval import multi_query_search
+
+QUESTION = "quem é a transmissora e qual o valor e vencimento?"
+
+WORDS = [
+    "transmissora", "empresa", "pagador", "cnpj", "valor", "vencimento",
+    "documento", "boleto", "beneficiario", "codigo", "ons", "multa", "juros",
+    "data", "processamento", "linha", "digitavel", "banco", "agencia", "conta"
+]
+
+def build_store(n_chunks, dim):
+    """
+    Cria um vectorstore FAISS com chunks sintéticos
+    """
+    rng = random.Random(42)
+    chunks = [" ".join(rng.choices(WORDS, k=40)) for _ in range(n_chunks)]
+    return FAISS.from_texts(chunks, FakeEmbeddings(size=dim))
+
+def time_ms(func, runs):
+    """
+    Tempo médio por chamada em milissegundos
+    """
+    func()
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=5000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--k", type=int, default=3)
+    args = parser.parse_args()
+
+    store = build_store(args.chunks, args.dim)
+
+    single = time_ms(lambda: store.similarity_search(QUESTION, k=args.k), args.runs)
+    multi = time_ms(lambda: multi_query_search(store, QUESTION, k=args.k), args.runs)
+
+    print(f"chunks={args.chunks} dim={args.dim} runs={args.runs} k={args.k}")
+    print(f"similarity_search:  {single:.3f} ms")
+    print(f"multi_query_search: {multi:.3f} ms")
+    print(f"overhead:           {multi - single:+.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 Componentes da barra lateral
 """
 import streamlit as st
-from config.settings import SUPPORTED_FILE_TYPES, URLS
+from config.settings import RAG_CONFIG, SUPPORTED_FILE_TYPES, URLS
 from utils.document_processor import process_uploaded_files
 
 def render_sidebar():
@@ -102,6 +102,22 @@ def render_document_section():
         st.session_state.vectorstore = None
         st.success("✅ Documentos removidos!")
     
+    # Busca multi-query: divide perguntas compostas em sub-perguntas
+    st.toggle(
+        "🔀 Busca multi-query",
+        value=RAG_CONFIG["multi_query"],
+        key="multi_query",
+        help="Divide perguntas compostas em sub-perguntas e combina os resultados"
+    )
+    
+    # Modo combinado: identificação, extração e RAG na mesma resposta
+    st.toggle(
+        "⚡ Resposta combinada",
+        value=RAG_CONFIG["combined_mode"],
+        key="combined_mode",
+        help="Executa identificação, extração do boleto e RAG em paralelo"
+    )
+    
     return uploaded_files
 
 def render_instructions_section():
@@ -121,6 +137,10 @@ def render_instructions_section():
     2. Faça upload de documentos
     3. Clique em "🚀 Processar"
     4. Faça perguntas sobre os documentos
+    
+    **Resposta combinada:**
+    Ative "⚡ Resposta combinada" para receber identificação, 
+    dados do boleto e resposta RAG em uma única pergunta
     """)
 
 def render_links_section():
@@ -13,7 +13,12 @@ PAGE_CONFIG = {
 RAG_CONFIG = {
     "chunk_size": 1000,
     "chunk_overlap": 200,
-    "similarity_search_k": 3
+    "similarity_search_k": 3,
+    "multi_query": False,
+    "multi_query_max_queries": 4,
+    "multi_query_fetch_k": 10,
+    "rrf_k": 60,
+    "combined_mode": False
 }
 
 SUPPORTED_FILE_TYPES = ['pdf', 'txt', 'docx']
@@ -1,8 +1,13 @@
+import time
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.schema import HumanMessage, AIMessage
-from config.settings import MODEL_CONFIG
+from config.settings import MODEL_CONFIG, RAG_CONFIG
 from utils.company_identifier import identify_companies_from_boleto
+from utils.boleto_extractor import extract_boleto_fields
+from utils.retrieval import retrieve_documents
 
 @st.cache_resource
 def init_model(api_key):
@@ -50,87 +55,179 @@ def get_normal_response(messages, llm):
     except Exception as e:
         return f"Erro ao gerar resposta: {str(e)}"
 
+def answer_from_docs(question, docs, llm):
+    """
+    Gera resposta do LLM com base nos documentos recuperados
+    """
+    context = "\n\n".join([doc.page_content for doc in docs])
+    
+    # Criar prompt com contexto
+    rag_prompt = f"""
+    Contexto dos documentos:
+    {context}
+    
+    Pergunta: {question}
+    
+    Com base apenas no contexto fornecido acima, responda à pergunta de forma clara e precisa. 
+    Se a informação não estiver no contexto, diga que não encontrou a informação nos documentos.
+    """
+    
+    response = llm.invoke([HumanMessage(content=rag_prompt)])
+    return response.content
+
 def get_rag_response(question, vectorstore, llm):
     """
     Gera resposta usando RAG (com documentos)
     """
     try:
-        from config.settings import RAG_CONFIG
-        
         # Buscar documentos relevantes
-        docs = vectorstore.similarity_search(
+        docs = retrieve_documents(
+            vectorstore,
             question, 
-            k=RAG_CONFIG["similarity_search_k"]
+            k=RAG_CONFIG["similarity_search_k"],
+            multi_query=st.session_state.get("multi_query", RAG_CONFIG["multi_query"])
         )
-        context = "\n\n".join([doc.page_content for doc in docs])
-        
-        # Criar prompt com contexto
-        rag_prompt = f"""
-        Contexto dos documentos:
-        {context}
-        
-        Pergunta: {question}
-        
-        Com base apenas no contexto fornecido acima, responda à pergunta de forma clara e precisa. 
-        Se a informação não estiver no contexto, diga que não encontrou a informação nos documentos.
-        """
         
-        response = llm.invoke([HumanMessage(content=rag_prompt)])
-        return response.content
+        return answer_from_docs(question, docs, llm)
         
     except Exception as e:
         return f"Erro ao gerar resposta RAG: {str(e)}"
-    
-def get_boleto_identification_response(question, vectorstore, llm):
+
+def format_identification_response(boleto_text):
     """
-    Identifica transmissora e empresa pagadora do boleto usando RAG + JSONs
+    Identifica as empresas no texto do boleto e formata a resposta
     """
-    try:
-        # Buscar documentos relevantes do boleto
-        docs = vectorstore.similarity_search(question, k=5)
-        boleto_text = "\n\n".join([doc.page_content for doc in docs])
-        
-        # Identificar empresas usando os JSONs
-        identification_result = identify_companies_from_boleto(boleto_text)
-        
-        # Criar resposta estruturada
-        response_parts = []
-        
-        if identification_result['transmissora']:
-            trans = identification_result['transmissora']
-            response_parts.append(f"""
+    # Identificar empresas usando os JSONs
+    identification_result = identify_companies_from_boleto(boleto_text)
+    
+    # Criar resposta estruturada
+    response_parts = []
+    
+    if identification_result['transmissora']:
+        trans = identification_result['transmissora']
+        response_parts.append(f"""
 🏢 **TRANSMISSORA IDENTIFICADA:**
 - Nome: {trans.get('nome')}
 - CNPJ: {trans.get('codigo_fornecedor')}
 - Código ONS: {trans.get('codigo_ons')}
 - ID: {trans.get('id_transmissora')}
-            """)
-        
-        if identification_result['empresa_pagadora']:
-            emp = identification_result['empresa_pagadora']
-            response_parts.append(f"""
+        """)
+    
+    if identification_result['empresa_pagadora']:
+        emp = identification_result['empresa_pagadora']
+        response_parts.append(f"""
 💼 **EMPRESA PAGADORA IDENTIFICADA:**
 - Nome: {emp.get('nome')}
 - CNPJ: {emp.get('cnpj')}
 - Categoria: {emp.get('categoria')}
 - Código: {emp.get('codigo')}
 - Código NeoEnergia: {emp.get('codigo_neoenergia')}
-            """)
-        
-        if identification_result['cnpjs_encontrados']:
-            cnpjs_list = ', '.join(identification_result['cnpjs_encontrados'])
-            response_parts.append(f"""
+        """)
+    
+    if identification_result['cnpjs_encontrados']:
+        cnpjs_list = ', '.join(identification_result['cnpjs_encontrados'])
+        response_parts.append(f"""
 🔍 **CNPJs ENCONTRADOS NO BOLETO:**
 {cnpjs_list}
-            """)
-        
-        if not identification_result['sucesso']:
-            response_parts.append("""
+        """)
+    
+    if not identification_result['sucesso']:
+        response_parts.append("""
 ⚠️ **Não foi possível identificar transmissora ou empresa pagadora.**
 Verifique se os CNPJs do boleto estão cadastrados nos JSONs.
-            """)
+        """)
+    
+    return "\n".join(response_parts)
+    
+def get_boleto_identification_response(question, vectorstore, llm):
+    """
+    Identifica transmissora e empresa pagadora do boleto usando RAG + JSONs
+    """
+    try:
+        # Buscar documentos relevantes do boleto
+        docs = retrieve_documents(
+            vectorstore,
+            question,
+            k=5,
+            multi_query=st.session_state.get("multi_query", RAG_CONFIG["multi_query"])
+        )
+        boleto_text = "\n\n".join([doc.page_content for doc in docs])
         
-        return "\n".join(response_parts)
+        return format_identification_response(boleto_text)
         
     except Exception as e:
-        return f"Erro na identificação do boleto: {str(e)}"
\ No newline at end of file
+        return f"Erro na identificação do boleto: {str(e)}"
+
+def format_extraction_response(boleto_text):
+    """
+    Extrai os campos estruturados do boleto e formata a resposta
+    """
+    fields = extract_boleto_fields(boleto_text)
+    
+    if not fields['sucesso']:
+        return "⚠️ **Não foi possível extrair valor, vencimento ou linha digitável do boleto.**"
+    
+    return f"""
+📋 **DADOS DO BOLETO:**
+- Valor: {f"R$ {fields['valor']}" if fields['valor'] else 'não encontrado'}
+- Vencimento: {fields['vencimento'] or 'não encontrado'}
+- Linha digitável: {fields['linha_digitavel'] or 'não encontrada'}
+    """
+
+def _run_timed(func, *args):
+    """
+    Executa uma função e retorna (resultado, erro, segundos); erro é None em caso de sucesso
+    """
+    start = time.perf_counter()
+    try:
+        return func(*args), None, time.perf_counter() - start
+    except Exception as e:
+        return None, e, time.perf_counter() - start
+
+def get_combined_response_stream(question, vectorstore, llm):
+    """
+    Executa identificação, extração e RAG em paralelo, entregando cada seção assim que fica pronta
+
+    Gera tuplas (titulo, conteudo, segundos). A busca no vectorstore é feita
+    uma única vez e compartilhada entre os três ramos.
+    """
+    # Busca compartilhada: k suficiente para identificação e RAG
+    docs, error, retrieval_time = _run_timed(
+        retrieve_documents,
+        vectorstore,
+        question,
+        max(5, RAG_CONFIG["similarity_search_k"]),
+        st.session_state.get("multi_query", RAG_CONFIG["multi_query"])
+    )
+    if error is not None:
+        yield "🔎 Busca", f"Erro na busca: {str(error)}", retrieval_time
+        return
+    
+    yield "🔎 Busca", f"{len(docs)} trecho(s) recuperado(s)", retrieval_time
+    
+    boleto_text = "\n\n".join([doc.page_content for doc in docs])
+    rag_docs = docs[:RAG_CONFIG["similarity_search_k"]]
+    
+    branches = {
+        "🏢 Identificação": (format_identification_response, boleto_text),
+        "📋 Extração": (format_extraction_response, boleto_text),
+        "📚 Resposta": (answer_from_docs, question, rag_docs, llm),
+    }
+    
+    # Propagar o contexto do Streamlit para as threads (st.error dentro dos ramos)
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=len(branches),
+        initializer=add_script_run_ctx,
+        initargs=(None, ctx)
+    ) as executor:
+        futures = {
+            executor.submit(_run_timed, *branch): title
+            for title, branch in branches.items()
+        }
+        
+        for future in as_completed(futures):
+            content, error, elapsed = future.result()
+            if error is not None:
+                content = f"Erro: {str(error)}"
+            yield futures[future], content, elapsed
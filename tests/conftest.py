@@ -0,0 +1,7 @@
+"""
+Configuração dos testes: permite importar os módulos a partir da raiz do projeto
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
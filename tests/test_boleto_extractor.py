@@ -0,0 +1,58 @@
+"""
+Testes da extração estruturada do boleto
+"""
+from utils.boleto_extractor import extract_boleto_fields, extract_valor, extract_vencimento
+
+def test_extract_valor_prefers_valor_do_documento():
+    assert extract_valor("Valores: multa 2,00. Valor do Documento R$ 1.234,56") == "1.234,56"
+
+def test_extract_vencimento_requires_label():
+    assert extract_vencimento("Data do documento 01/10/2026") is None
+    assert extract_vencimento("Vencimento: 15/11/2026") == "15/11/2026"
+
+def test_extract_boleto_fields_ignores_cnpj_only_chunk():
+    result = extract_boleto_fields("Beneficiário CNPJ 12.345.678/0001-90")
+    assert result == {
+        'valor': None,
+        'vencimento': None,
+        'linha_digitavel': None,
+        'sucesso': False,
+    }
+
+def test_extract_boleto_fields_full_boleto():
+    text = (
+        "Data de Vencimento: 15/11/2026\n"
+        "Valor do Documento R$ 1.234,56\n"
+        "23790.12345 60000.123456 78901.234567 8 12340000123456"
+    )
+    result = extract_boleto_fields(text)
+    assert result['valor'] == "1.234,56"
+    assert result['vencimento'] == "15/11/2026"
+    assert result['linha_digitavel'] == "23790.12345 60000.123456 78901.234567 8 12340000123456"
+    assert result['sucesso']
+
+def test_extract_boleto_fields_multiline_layout():
+    text = (
+        "Vencimento\n15/11/2026\n"
+        "Valor do Documento\n1.234,56\n"
+        "Após o vencimento cobrar multa de R$ 24,69"
+    )
+    result = extract_boleto_fields(text)
+    assert result['valor'] == "1.234,56"
+    assert result['vencimento'] == "15/11/2026"
+    assert result['sucesso']
+
+def test_extract_valor_ignores_unlabeled_fine():
+    text = "Após o vencimento cobrar multa de R$ 24,69 e juros de R$ 0,41 ao dia"
+    assert extract_valor(text) is None
+
+def test_extract_valor_single_unlabeled_amount():
+    assert extract_valor("Total a pagar: R$ 350,00") == "350,00"
+
+def test_extract_valor_without_thousands_separator():
+    result = extract_boleto_fields("Valor do Documento R$ 1234,56")
+    assert result['valor'] == "1234,56"
+    assert result['sucesso']
+
+def test_extract_vencimento_two_digit_year():
+    assert extract_vencimento("Vencimento 15/11/26") == "15/11/26"
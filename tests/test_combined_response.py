@@ -0,0 +1,102 @@
+"""
+Testes da resposta combinada (identificação, extração e RAG em paralelo)
+"""
+import time
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("langchain_google_genai")
+
+from langchain_core.documents import Document
+from models import chat_model
+
+IDENTIFICATION_DELAY = 0.1
+EXTRACTION_DELAY = 0.2
+LLM_DELAY = 0.3
+
+class FakeVectorstore:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def similarity_search(self, question, k):
+        if self.fail:
+            raise RuntimeError("índice indisponível")
+        return [Document(page_content="Vencimento 15/11/2026\nValor do Documento R$ 1.234,56")]
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+class FakeLLM:
+    def invoke(self, messages):
+        time.sleep(LLM_DELAY)
+        return FakeResponse("resposta do RAG")
+
+def fake_identification(boleto_text):
+    time.sleep(IDENTIFICATION_DELAY)
+    return {
+        'transmissora': None,
+        'empresa_pagadora': None,
+        'cnpjs_encontrados': [],
+        'sucesso': False
+    }
+
+def fake_extraction(boleto_text):
+    time.sleep(EXTRACTION_DELAY)
+    return {'valor': '1.234,56', 'vencimento': '15/11/2026', 'linha_digitavel': None, 'sucesso': True}
+
+def failing_extraction(boleto_text):
+    time.sleep(EXTRACTION_DELAY)
+    raise ValueError("falha na extração")
+
+@pytest.fixture(autouse=True)
+def patch_branches(monkeypatch):
+    # Sem contexto de script do Streamlit: session_state vazio e busca simples
+    monkeypatch.setattr(chat_model.st, "session_state", {})
+    monkeypatch.setattr(chat_model, "identify_companies_from_boleto", fake_identification)
+    monkeypatch.setattr(chat_model, "extract_boleto_fields", fake_extraction)
+
+def run_stream(vectorstore):
+    start = time.perf_counter()
+    sections = list(chat_model.get_combined_response_stream("qual o valor?", vectorstore, FakeLLM()))
+    return sections, time.perf_counter() - start
+
+def test_sections_arrive_as_branches_finish():
+    sections, total = run_stream(FakeVectorstore())
+
+    titles = [title for title, _, _ in sections]
+    assert titles == ["🔎 Busca", "🏢 Identificação", "📋 Extração", "📚 Resposta"]
+
+    timings = {title: elapsed for title, _, elapsed in sections}
+    assert timings["🏢 Identificação"] == pytest.approx(IDENTIFICATION_DELAY, abs=0.05)
+    assert timings["📋 Extração"] == pytest.approx(EXTRACTION_DELAY, abs=0.05)
+    assert timings["📚 Resposta"] == pytest.approx(LLM_DELAY, abs=0.05)
+
+    # Latência total próxima do ramo mais lento, não da soma dos ramos
+    slowest = max(IDENTIFICATION_DELAY, EXTRACTION_DELAY, LLM_DELAY)
+    total_sum = IDENTIFICATION_DELAY + EXTRACTION_DELAY + LLM_DELAY
+    assert total < slowest + 0.1
+    assert total < total_sum
+
+    contents = {title: content for title, content, _ in sections}
+    assert "1.234,56" in contents["📋 Extração"]
+    assert contents["📚 Resposta"] == "resposta do RAG"
+
+def test_branch_error_does_not_block_other_sections(monkeypatch):
+    monkeypatch.setattr(chat_model, "extract_boleto_fields", failing_extraction)
+
+    sections, _ = run_stream(FakeVectorstore())
+
+    contents = {title: content for title, content, _ in sections}
+    assert contents["📋 Extração"] == "Erro: falha na extração"
+    assert contents["📚 Resposta"] == "resposta do RAG"
+    assert "🏢 Identificação" in contents
+
+def test_retrieval_error_stops_before_branches():
+    sections, total = run_stream(FakeVectorstore(fail=True))
+
+    assert len(sections) == 1
+    title, content, _ = sections[0]
+    assert title == "🔎 Busca"
+    assert content == "Erro na busca: índice indisponível"
+    assert total < IDENTIFICATION_DELAY
@@ -0,0 +1,60 @@
+"""
+Testes da recuperação multi-query
+"""
+import pytest
+
+pytest.importorskip("faiss")
+pytest.importorskip("langchain_community")
+
+from langchain_community.vectorstores import FAISS
+from utils.fake_embeddings import FakeEmbeddings
+from utils.retrieval import expand_query, multi_query_search, reciprocal_rank_fusion
+
+def test_expand_query_splits_compound_question():
+    queries = expand_query("quem é a transmissora e qual o valor e vencimento?")
+    assert queries == [
+        "quem é a transmissora e qual o valor e vencimento?",
+        "quem é a transmissora",
+        "qual o valor e vencimento",
+    ]
+
+@pytest.mark.parametrize("question", [
+    "Olá, qual o valor do boleto?",
+    "Por favor, qual o vencimento?",
+    "Qual o valor total de R$ 1.234,56?",
+    "Qual o nome e CNPJ da transmissora?",
+])
+def test_expand_query_keeps_simple_question(question):
+    assert expand_query(question) == [question]
+
+def test_expand_query_respects_max_queries():
+    queries = expand_query("qual o valor; qual o vencimento; quem é o pagador", max_queries=2)
+    assert len(queries) == 2
+
+def test_reciprocal_rank_fusion_orders_by_combined_rank():
+    assert reciprocal_rank_fusion([[1, 2, 3], [3, 4], [2, 3]], rrf_k=60) == [3, 2, 1, 4]
+
+def test_multi_query_search_batches_embeddings_and_handles_padding():
+    embeddings = FakeEmbeddings()
+    store = FAISS.from_texts(
+        ["transmissora Sul CNPJ", "valor do documento 1.234,56", "vencimento 15/11/2026"],
+        embeddings
+    )
+    embeddings.document_calls = 0
+
+    # fetch_k maior que o índice: FAISS preenche com -1
+    docs = multi_query_search(store, "quem é a transmissora e qual o valor?", k=10)
+
+    assert embeddings.document_calls == 1
+    assert len(docs) == 3
+
+def test_multi_query_search_removes_duplicate_chunks():
+    store = FAISS.from_texts(
+        ["transmissora Sul", "transmissora Sul", "valor do documento"],
+        FakeEmbeddings()
+    )
+
+    docs = multi_query_search(store, "quem é a transmissora e qual o valor?", k=3)
+
+    contents = [doc.page_content for doc in docs]
+    assert sorted(contents) == ["transmissora Sul", "valor do documento"]
@@ -0,0 +1,60 @@
+"""
+Extração estruturada de dados do boleto (valor, vencimento, linha digitável)
+"""
+import re
+
+# Valor monetário no formato brasileiro: 1.234,56 ou 1234,56
+AMOUNT_PATTERN = r'\d{1,3}(?:\.?\d{3})*,\d{2}'
+VALOR_PATTERN = rf'(?:R\$\s*)?({AMOUNT_PATTERN})'
+
+# Entre rótulo e valor: texto sem dígitos, com no máximo uma quebra de linha (layout do PyPDF2)
+LABEL_GAP = r'[^\d\n]{0,30}(?:\n[^\d\n]{0,30})?'
+
+def extract_valor(text):
+    """
+    Extrai o valor do documento (R$)
+    """
+    label_patterns = [
+        # Priorizar o rótulo completo do boleto
+        r'\bvalor (?:do documento|cobrado)\b',
+        r'\bvalor\b',
+    ]
+    for label in label_patterns:
+        match = re.search(label + LABEL_GAP + VALOR_PATTERN, text, re.IGNORECASE)
+        if match:
+            return match.group(1)
+
+    # Sem rótulo: aceitar apenas se o texto tiver um único valor (evita pegar multa ou juros)
+    amounts = re.findall(rf'(?<![\d.,])({AMOUNT_PATTERN})(?![\d,])', text)
+    return amounts[0] if len(amounts) == 1 else None
+
+def extract_vencimento(text):
+    """
+    Extrai a data de vencimento (apenas quando há o rótulo "vencimento")
+    """
+    pattern = r'vencimento' + LABEL_GAP + r'(\d{2}/\d{2}/(?:\d{4}|\d{2}))\b'
+    match = re.search(pattern, text, re.IGNORECASE)
+    return match.group(1) if match else None
+
+def extract_linha_digitavel(text):
+    """
+    Extrai a linha digitável do boleto (47 dígitos, com ou sem formatação)
+    """
+    pattern = r'\d{5}\.?\d{5}\s*\d{5}\.?\d{6}\s*\d{5}\.?\d{6}\s*\d\s*\d{14}'
+    match = re.search(pattern, text)
+    return match.group(0) if match else None
+
+def extract_boleto_fields(boleto_text):
+    """
+    Extrai os campos estruturados do texto do boleto
+    """
+    result = {
+        'valor': extract_valor(boleto_text),
+        'vencimento': extract_vencimento(boleto_text),
+        'linha_digitavel': extract_linha_digitavel(boleto_text),
+    }
+
+    # Marcar como sucesso se encontrou pelo menos um campo
+    result['sucesso'] = any(result.values())
+
+    return result
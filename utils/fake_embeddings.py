@@ -0,0 +1,29 @@
+"""
+Embeddings determinísticos para testes e benchmarks (sem API key)
+"""
+import hashlib
+import re
+from langchain_core.embeddings import Embeddings
+
+class FakeEmbeddings(Embeddings):
+    """
+    Bag-of-words com hash das palavras: textos com palavras em comum ficam próximos
+    """
+
+    def __init__(self, size=64):
+        self.size = size
+        self.document_calls = 0
+
+    def _embed(self, text):
+        vector = [0.0] * self.size
+        for word in re.findall(r'\w+', text.lower()):
+            digest = hashlib.md5(word.encode("utf-8")).digest()
+            vector[int.from_bytes(digest[:4], "little") % self.size] += 1.0
+        return vector
+
+    def embed_documents(self, texts):
+        self.document_calls += 1
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
@@ -0,0 +1,169 @@
+"""
+Recuperação multi-query: expande a pergunta em sub-perguntas e faz uma única busca FAISS em lote
+"""
+import inspect
+import re
+import faiss
+import numpy as np
+from config.settings import RAG_CONFIG
+
+# Separadores de cláusulas em perguntas compostas (vírgula entre dígitos faz parte de valores)
+CLAUSE_SEPARATORS = r'\?|;|(?<!\d),|,(?!\d)|\s+também\s+|\s+além disso\s+'
+
+# Palavras que iniciam uma pergunta
+INTERROGATIVES = r'qual|quais|quem|quando|onde|como|quanto|quanta|quantos|quantas|o que|por que'
+
+# "e" só separa cláusulas quando o lado direito começa uma nova pergunta
+CONJUNCTION_SEPARATOR = rf'\s+e\s+(?=(?:{INTERROGATIVES})\b)'
+
+# Saudações e palavras sem conteúdo para busca
+FILLER_WORDS = {
+    'olá', 'ola', 'oi', 'bom', 'boa', 'dia', 'tarde', 'noite', 'por', 'favor',
+    'obrigado', 'obrigada', 'gostaria', 'saber', 'me', 'diga', 'informe',
+    'qual', 'quais', 'quem', 'quando', 'onde', 'como', 'quanto', 'quanta',
+    'quantos', 'quantas', 'que', 'é', 'são', 'foi', 'o', 'a', 'os', 'as',
+    'um', 'uma', 'de', 'do', 'da', 'dos', 'das', 'no', 'na', 'em', 'e', 'para'
+}
+
+def is_question_clause(clause):
+    """
+    Verifica se a cláusula começa com uma palavra interrogativa
+    """
+    return re.match(rf'(?:{INTERROGATIVES})\b', clause, re.IGNORECASE) is not None
+
+def has_search_content(clause):
+    """
+    Verifica se a cláusula tem pelo menos uma palavra útil para a busca
+    """
+    words = re.findall(r'\w+', clause.lower())
+    return any(word not in FILLER_WORDS and len(word) > 2 for word in words)
+
+def split_clauses(question):
+    """
+    Divide a pergunta em cláusulas candidatas a sub-perguntas
+    """
+    clauses = []
+    for part in re.split(CLAUSE_SEPARATORS, question, flags=re.IGNORECASE):
+        pieces = re.split(CONJUNCTION_SEPARATOR, part.strip(), flags=re.IGNORECASE)
+
+        # "e" entre duas perguntas: "quem é a transmissora e qual o valor"
+        if len(pieces) > 1 and not is_question_clause(pieces[0]):
+            pieces = [part]
+
+        clauses.extend(piece.strip(" .!") for piece in pieces)
+
+    return [clause for clause in clauses if has_search_content(clause)]
+
+def expand_query(question, max_queries=None):
+    """
+    Expande a pergunta em sub-perguntas usando regras (sem chamada ao LLM)
+    """
+    if max_queries is None:
+        max_queries = RAG_CONFIG["multi_query_max_queries"]
+
+    question = question.strip()
+    clauses = split_clauses(question)
+
+    # Pergunta com uma única cláusula útil: não expandir
+    if len(clauses) < 2:
+        return [question]
+
+    queries = [question]
+    vistos = {question.strip(" .!?").lower()}
+
+    for clausula in clauses:
+        if clausula.lower() in vistos:
+            continue
+
+        queries.append(clausula)
+        vistos.add(clausula.lower())
+
+        if len(queries) >= max_queries:
+            break
+
+    return queries
+
+def embed_queries(vectorstore, queries):
+    """
+    Gera os embeddings de todas as sub-perguntas em uma única chamada
+    """
+    embeddings = vectorstore.embeddings
+    if embeddings is None:
+        # Vectorstore criado com função de embedding simples
+        return [vectorstore.embedding_function(query) for query in queries]
+
+    # GoogleGenerativeAIEmbeddings: manter a semântica de consulta do embed_query
+    if "task_type" in inspect.signature(embeddings.embed_documents).parameters:
+        return embeddings.embed_documents(queries, task_type="RETRIEVAL_QUERY")
+
+    return embeddings.embed_documents(queries)
+
+def reciprocal_rank_fusion(ranked_lists, rrf_k=None):
+    """
+    Combina listas ranqueadas de ids usando Reciprocal Rank Fusion
+    """
+    if rrf_k is None:
+        rrf_k = RAG_CONFIG["rrf_k"]
+
+    scores = {}
+    for ranked_ids in ranked_lists:
+        for rank, doc_id in enumerate(ranked_ids):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (rrf_k + rank + 1)
+
+    # sorted é estável: empates mantêm a ordem da primeira aparição
+    return sorted(scores, key=scores.get, reverse=True)
+
+def multi_query_search(vectorstore, question, k=None):
+    """
+    Busca documentos com várias sub-perguntas em uma única busca FAISS em lote
+    """
+    if k is None:
+        k = RAG_CONFIG["similarity_search_k"]
+
+    queries = expand_query(question)
+
+    # Pergunta simples: não há o que fundir
+    if len(queries) == 1:
+        return vectorstore.similarity_search(question, k=k)
+
+    # Embeddings em lote e uma única busca no índice
+    vectors = np.asarray(embed_queries(vectorstore, queries), dtype=np.float32)
+    if getattr(vectorstore, "_normalize_L2", False):
+        faiss.normalize_L2(vectors)
+
+    fetch_k = max(k, RAG_CONFIG["multi_query_fetch_k"])
+    _, indices = vectorstore.index.search(vectors, fetch_k)
+
+    # FAISS retorna -1 quando há menos vetores que fetch_k
+    ranked_lists = [[int(i) for i in row if i != -1] for row in indices]
+
+    # Fundir rankings e remover chunks duplicados
+    docs = []
+    conteudos_vistos = set()
+    for index_id in reciprocal_rank_fusion(ranked_lists):
+        doc = vectorstore.docstore.search(vectorstore.index_to_docstore_id[index_id])
+        if isinstance(doc, str) or doc.page_content in conteudos_vistos:
+            continue
+
+        conteudos_vistos.add(doc.page_content)
+        docs.append(doc)
+
+        if len(docs) >= k:
+            break
+
+    return docs
+
+def retrieve_documents(vectorstore, question, k=None, multi_query=None):
+    """
+    Recupera documentos relevantes usando multi-query ou busca simples conforme configuração
+    """
+    if k is None:
+        k = RAG_CONFIG["similarity_search_k"]
+
+    if multi_query is None:
+        multi_query = RAG_CONFIG["multi_query"]
+
+    if multi_query:
+        return multi_query_search(vectorstore, question, k=k)
+
+    return vectorstore.similarity_search(question, k=k)